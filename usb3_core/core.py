@@ -16,6 +16,24 @@ from usb3_pipe.serdes import RXWordAligner
 
 # USB3 Core Endpoint --------------------------------------------------------------------------------
 
+# Endpoint ports of usb3_top_usb3_pipe: (name, direction seen from the Daisho core).
+usb3_endpoint_ports = [
+    ("buf_in_addr",       "i"),
+    ("buf_in_data",       "i"),
+    ("buf_in_wren",       "i"),
+    ("buf_in_request",    "o"),
+    ("buf_in_ready",      "o"),
+    ("buf_in_commit",     "i"),
+    ("buf_in_commit_len", "i"),
+    ("buf_in_commit_ack", "o"),
+    ("buf_out_addr",      "i"),
+    ("buf_out_q",         "o"),
+    ("buf_out_len",       "o"),
+    ("buf_out_hasdata",   "o"),
+    ("buf_out_arm",       "i"),
+    ("buf_out_arm_ack",   "o"),
+]
+
 class USB3CoreEndpoint(Module, AutoCSR):
     def __init__(self):
         # Not functional but prevents synthesis optimizations
@@ -92,15 +110,7 @@ class USB3Core(Module, AutoCSR):
         self.submodules.aligner = aligner
         self.comb += sink.connect(aligner.sink)
 
-        in_data   = Signal(32)
-        in_datak  = Signal(4)
-        in_active = Signal()
-        self.comb += [
-            aligner.source.ready.eq(1), # Always ready
-            in_data.eq(aligner.source.data),
-            in_datak.eq(aligner.source.ctrl),
-            in_active.eq(aligner.source.valid),
-        ]
+        self.comb += aligner.source.ready.eq(1) # Always ready
 
         # TX (Source) ------------------------------------------------------------------------------
         # Daisho core does not support back-pressure (ready signal of LiteX's streams). To accomodate
@@ -159,24 +169,9 @@ class USB3Core(Module, AutoCSR):
 
         # Daisho USB3 core endpoinst ---------------------------------------------------------------
         if with_endpoint:
-            self.submodules.usb3_control = usb3_control = USB3CoreControl()
-            usb3_top_params.update(
-                i_buf_in_addr       = usb3_control.buf_in_addr,
-                i_buf_in_data       = usb3_control.buf_in_data,
-                i_buf_in_wren       = usb3_control.buf_in_wren,
-                o_buf_in_request    = usb3_control.buf_in_request,
-                o_buf_in_ready      = usb3_control.buf_in_ready,
-                i_buf_in_commit     = usb3_control.buf_in_commit,
-                i_buf_in_commit_len = usb3_control.buf_in_commit_len,
-                o_buf_in_commit_ack = usb3_control.buf_in_commit_ack,
-
-                i_buf_out_addr      = usb3_control.buf_out_addr,
-                o_buf_out_q         = usb3_control.buf_out_q,
-                o_buf_out_len       = usb3_control.buf_out_len,
-                o_buf_out_hasdata   = usb3_control.buf_out_hasdata,
-                i_buf_out_arm       = usb3_control.buf_out_arm,
-                o_buf_out_arm_ack   = usb3_control.buf_out_arm_ack,
-            )
+            self.submodules.usb3_control = usb3_control = USB3CoreEndpoint()
+            for name, direction in usb3_endpoint_ports:
+                usb3_top_params[direction + "_" + name] = getattr(usb3_control, name)
 
         # Daisho USB3 instance ---------------------------------------------------------------------
         self.specials += Instance("usb3_top_usb3_pipe", **usb3_top_params)
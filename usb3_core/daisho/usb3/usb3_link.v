@@ -274,12 +274,11 @@ parameter	[3:0]	WR_HP_RESET		= 'd0,
 	reg		[7:0]	link_error_count;
 	
 	reg				force_linkpm_accept;
-	reg		[24:0]	pm_lc_timer;									// not used unless this port initiates power modes (LGO_Ux)
-	reg		[24:0]	pm_entry_timer;		// new
+	reg		[9:0]	pm_entry_timer;		// new, sized for T_PM_ENTRY
 	reg		[24:0]	ux_exit_timer;		// new
 	reg				pm_waiting_for_ack;
 	
-	reg		[24:0]	port_config_timeout;
+	reg		[11:0]	port_config_timeout;	// sized for T_PORT_CONFIG
 	reg		[24:0]	T_PORT_U2_TIMEOUT;
 	
 	reg		[2:0]	tx_hdr_seq_num /* synthesis noprune */;			// Header Sequence Number (0-7)
@@ -310,14 +309,10 @@ parameter	[3:0]	WR_HP_RESET		= 'd0,
 	reg		[95:0]	in_header_pkt_c;
 	reg		[95:0]	in_header_pkt_d;
 	reg		[1:0]	out_header_pkt_pick;
-	wire	[95:0]	out_header_pkt_mux = (	out_header_pkt_pick == 0 ? out_header_pkt_a :
-											out_header_pkt_pick == 1 ? out_header_pkt_b :
-											out_header_pkt_pick == 2 ? out_header_pkt_c : 
-											out_header_pkt_d );
-	reg		[95:0]	out_header_pkt_a;
-	reg		[95:0]	out_header_pkt_b;
-	reg		[95:0]	out_header_pkt_c;
-	reg		[95:0]	out_header_pkt_d;
+	// one entry per remote credit; written once and read back by index,
+	// so it can map to distributed RAM instead of 4 regs + a 4:1 mux
+	reg		[95:0]	out_header_pkt [0:3];
+	wire	[95:0]	out_header_pkt_mux = out_header_pkt[out_header_pkt_pick];
 	
 	/*
 	output	reg		[31:0]	out_data,
@@ -603,7 +598,6 @@ always @(posedge local_clk) begin
 		u0_recovery_timeout <= 0;
 		pending_hp_timer <= 0;
 		credit_hp_timer <= 0;
-		pm_lc_timer <= 0;
 		pm_entry_timer <= 0;
 		ux_exit_timer <= 0;
 		port_config_timeout <= 0;
@@ -793,15 +787,10 @@ always @(posedge local_clk) begin
 	LINK_EXPECT_HDR_SEQ_AD: begin
 		if(ltssm_state == LT_U0) begin
 			// now it should happen
+			// LGOOD_n: next expected ACK is n+1 (wraps modulo 8)
+			if(rx_lcmd_act && rx_lcmd[10:3] == LCMD_LGOOD_0[10:3])
+				ack_tx_hdr_seq_num <= rx_lcmd[2:0] + 3'h1;
 			case({rx_lcmd, rx_lcmd_act})
-			{LCMD_LGOOD_0, 1'b1}: ack_tx_hdr_seq_num <= 1;
-			{LCMD_LGOOD_1, 1'b1}: ack_tx_hdr_seq_num <= 2;
-			{LCMD_LGOOD_2, 1'b1}: ack_tx_hdr_seq_num <= 3;
-			{LCMD_LGOOD_3, 1'b1}: ack_tx_hdr_seq_num <= 4;
-			{LCMD_LGOOD_4, 1'b1}: ack_tx_hdr_seq_num <= 5;
-			{LCMD_LGOOD_5, 1'b1}: ack_tx_hdr_seq_num <= 6;
-			{LCMD_LGOOD_6, 1'b1}: ack_tx_hdr_seq_num <= 7;
-			{LCMD_LGOOD_7, 1'b1}: ack_tx_hdr_seq_num <= 0;
 			{LCMD_LCRD_A, 1'b1}: begin 
 				//`INC(remote_rx_cred_count); 
 				remote_rx_cred_count_inc <= 1;
@@ -1002,7 +991,9 @@ always @(posedge local_clk) begin
 		LP_TYPE_LMP: begin
 			case(in_header_pkt_mux[8:5])
 			LP_LMP_SUB_SETLINK: force_linkpm_accept <= in_header_pkt_mux[10];
-			LP_LMP_SUB_U2INACT: T_PORT_U2_TIMEOUT <= in_header_pkt_mux[16:9] * 32000; // 256 uS units
+			LP_LMP_SUB_U2INACT: T_PORT_U2_TIMEOUT <= {in_header_pkt_mux[16:9], 15'd0} -
+													 {in_header_pkt_mux[16:9],  9'd0} -
+													 {in_header_pkt_mux[16:9],  8'd0}; // x*32000, 256 uS units
 			LP_LMP_SUB_VENDTEST: begin end
 			LP_LMP_SUB_PORTCAP: begin 
 				recv_port_cmdcfg[1] <= 1'b1;
@@ -1402,12 +1393,8 @@ always @(posedge local_clk) begin
 	end
 	LINK_SEND_HP_0: begin
 		// commit built packet to queue
-		case(tx_cred_idx)
-		0: out_header_pkt_a <= {tx_hp_word_0, tx_hp_word_1, tx_hp_word_2};
-		1: out_header_pkt_b <= {tx_hp_word_0, tx_hp_word_1, tx_hp_word_2};
-		2: out_header_pkt_c <= {tx_hp_word_0, tx_hp_word_1, tx_hp_word_2};
-		3: out_header_pkt_d <= {tx_hp_word_0, tx_hp_word_1, tx_hp_word_2};
-		endcase	
+		// store byte-swapped so WR_HP_1 can send the words as-is
+		out_header_pkt[tx_cred_idx] <= {swap32(tx_hp_word_0), swap32(tx_hp_word_1), swap32(tx_hp_word_2)};
 		// set to relevant one
 		out_header_pkt_pick <= tx_cred_idx;
 		
@@ -1486,9 +1473,9 @@ always @(posedge local_clk) begin
 	end
 	WR_HP_1: begin
 		case(sc)
-		0: out_data_2 <= swap32(out_header_pkt_mux[95:64]);
-		1: out_data_2 <= swap32(out_header_pkt_mux[63:32]);
-		2: out_data_2 <= swap32(out_header_pkt_mux[31:0]);
+		0: out_data_2 <= out_header_pkt_mux[95:64];
+		1: out_data_2 <= out_header_pkt_mux[63:32];
+		2: out_data_2 <= out_header_pkt_mux[31:0];
 		endcase		
 		if(sc == 0) begin
 			last_hdr_seq_num <= tx_hdr_seq_num;
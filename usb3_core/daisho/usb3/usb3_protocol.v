@@ -131,60 +131,67 @@ output	reg				err_missed_dpp_done
 `include "usb3_const.vh"	
 	
 	// mux bram signals
-	wire	[8:0]	ep0_buf_in_addr		= 	rx_endp == SEL_ENDP0 ? buf_in_addr : 'h0;
-	wire	[31:0]	ep0_buf_in_data		= 	rx_endp == SEL_ENDP0 ? buf_in_data : 'h0;
-	wire			ep0_buf_in_wren		= 	rx_endp == SEL_ENDP0 ? buf_in_wren : 'h0;
+	// decode the endpoint selects once, every mux below shares them
+	wire			rx_ep0				=	rx_endp == SEL_ENDP0;
+	wire			rx_ep2				=	rx_endp == SEL_ENDP2;
+	wire			tx_ep0				=	tx_endp == SEL_ENDP0;
+	wire			tx_ep1				=	tx_endp == SEL_ENDP1;
+	
+	// write address/data go to every endpoint, only wren is steered
+	wire	[8:0]	ep0_buf_in_addr		= 	buf_in_addr;
+	wire	[31:0]	ep0_buf_in_data		= 	buf_in_data;
+	wire			ep0_buf_in_wren		= 	rx_ep0 ? buf_in_wren : 'h0;
 	wire			ep0_buf_in_ready;
-	wire			ep0_buf_in_commit	= 	rx_endp == SEL_ENDP0 ? buf_in_commit : 'h0;
-	wire	[10:0]	ep0_buf_in_commit_len = rx_endp == SEL_ENDP0 ? buf_in_commit_len : 'h0;
+	wire			ep0_buf_in_commit	= 	rx_ep0 ? buf_in_commit : 'h0;
+	wire	[10:0]	ep0_buf_in_commit_len = rx_ep0 ? buf_in_commit_len : 'h0;
 	wire			ep0_buf_in_commit_ack;
 
-	wire	[8:0]	ep0_buf_out_addr	= 	tx_endp == SEL_ENDP0 ? buf_out_addr : 'h0;
+	wire	[8:0]	ep0_buf_out_addr	= 	tx_ep0 ? buf_out_addr : 'h0;
 	wire	[31:0]	ep0_buf_out_q;
 	wire	[10:0]	ep0_buf_out_len;
 	wire			ep0_buf_out_hasdata;
-	wire			ep0_buf_out_arm		= 	tx_endp == SEL_ENDP0 ? buf_out_arm : 'h0;
+	wire			ep0_buf_out_arm		= 	tx_ep0 ? buf_out_arm : 'h0;
 	wire			ep0_buf_out_arm_ack;
 	
-	wire	[8:0]	ep1_buf_out_addr	= 	tx_endp == SEL_ENDP1 ? buf_out_addr : 'h0;
+	wire	[8:0]	ep1_buf_out_addr	= 	tx_ep1 ? buf_out_addr : 'h0;
 	wire	[31:0]	ep1_buf_out_q;
 	wire	[10:0]	ep1_buf_out_len;	
 	wire			ep1_buf_out_hasdata;
-	wire			ep1_buf_out_arm		= 	tx_endp == SEL_ENDP1 ? buf_out_arm : 'h0;
+	wire			ep1_buf_out_arm		= 	tx_ep1 ? buf_out_arm : 'h0;
 	wire			ep1_buf_out_arm_ack;
 
-	wire	[8:0]	ep2_buf_in_addr		= 	rx_endp == SEL_ENDP2 ? buf_in_addr : 'h0;
-	wire	[31:0]	ep2_buf_in_data		= 	rx_endp == SEL_ENDP2 ? buf_in_data : 'h0;
-	wire			ep2_buf_in_wren		= 	rx_endp == SEL_ENDP2 ? buf_in_wren : 'h0;
+	wire	[8:0]	ep2_buf_in_addr		= 	buf_in_addr;
+	wire	[31:0]	ep2_buf_in_data		= 	buf_in_data;
+	wire			ep2_buf_in_wren		= 	rx_ep2 ? buf_in_wren : 'h0;
 	wire			ep2_buf_in_ready;
-	wire			ep2_buf_in_commit 	= 	rx_endp == SEL_ENDP2 ? buf_in_commit : 'h0;
-	wire	[10:0]	ep2_buf_in_commit_len = rx_endp == SEL_ENDP2 ? buf_in_commit_len : 'h0;
+	wire			ep2_buf_in_commit 	= 	rx_ep2 ? buf_in_commit : 'h0;
+	wire	[10:0]	ep2_buf_in_commit_len = rx_ep2 ? buf_in_commit_len : 'h0;
 	wire			ep2_buf_in_commit_ack;
 
 										
-	assign			buf_in_ready		= 	rx_endp == SEL_ENDP0 ? ep0_buf_in_ready : 
-											rx_endp == SEL_ENDP2 ? ep2_buf_in_ready : 'h0;
+	assign			buf_in_ready		= 	rx_ep0 ? ep0_buf_in_ready : 
+											rx_ep2 ? ep2_buf_in_ready : 'h0;
 											
-	assign			buf_in_commit_ack	= 	rx_endp == SEL_ENDP0 ? ep0_buf_in_commit_ack : 
-											rx_endp == SEL_ENDP2 ? ep2_buf_in_commit_ack : 'h0;
+	assign			buf_in_commit_ack	= 	rx_ep0 ? ep0_buf_in_commit_ack : 
+											rx_ep2 ? ep2_buf_in_commit_ack : 'h0;
 
-	assign			buf_out_q			= 	tx_endp == SEL_ENDP0 ? ep0_buf_out_q :
-											tx_endp == SEL_ENDP1 ? ep1_buf_out_q : 'h0;
+	assign			buf_out_q			= 	tx_ep0 ? ep0_buf_out_q :
+											tx_ep1 ? ep1_buf_out_q : 'h0;
 											
-	assign			buf_out_len			= 	tx_endp == SEL_ENDP0 ? ep0_buf_out_len : 
-											tx_endp == SEL_ENDP1 ? ep1_buf_out_len : 'h0;
+	assign			buf_out_len			= 	tx_ep0 ? ep0_buf_out_len : 
+											tx_ep1 ? ep1_buf_out_len : 'h0;
 											
-	assign			buf_out_hasdata		= 	tx_endp == SEL_ENDP0 ? ep0_buf_out_hasdata : 
-											tx_endp == SEL_ENDP1 ? ep1_buf_out_hasdata : 'h0;
+	assign			buf_out_hasdata		= 	tx_ep0 ? ep0_buf_out_hasdata : 
+											tx_ep1 ? ep1_buf_out_hasdata : 'h0;
 											
-	assign			buf_out_arm_ack		= 	tx_endp == SEL_ENDP0 ? ep0_buf_out_arm_ack : 
-											tx_endp == SEL_ENDP1 ? ep1_buf_out_arm_ack : 'h0;
+	assign			buf_out_arm_ack		= 	tx_ep0 ? ep0_buf_out_arm_ack : 
+											tx_ep1 ? ep1_buf_out_arm_ack : 'h0;
 											
-	assign			endp_mode_tx		=	tx_endp == SEL_ENDP1 ? EP1_MODE : 
+	assign			endp_mode_tx		=	tx_ep1 ? EP1_MODE : 
 											tx_endp == SEL_ENDP2 ? EP2_MODE : EP_MODE_CONTROL;
 											
 	assign			endp_mode_rx		=	rx_endp == SEL_ENDP1 ? EP1_MODE : 
-											rx_endp == SEL_ENDP2 ? EP2_MODE : EP_MODE_CONTROL;										
+											rx_ep2 ? EP2_MODE : EP_MODE_CONTROL;										
 											
 	parameter [3:0]	SEL_ENDP0 			= 4'd0,
 					SEL_ENDP1 			= 4'd1,
@@ -239,7 +246,6 @@ parameter	[4:0]	TX_RESET		= 'd0,
 	reg				do_send_dpp;
 	
 	reg		[10:0]	recv_count;
-	reg		[10:0]	dc;
 	
 	reg		[3:0]	rx_endp;
 	reg		[3:0]	tx_endp;
@@ -255,8 +261,8 @@ always @(posedge local_clk) begin
 	
 	ext_buf_in_request <= 0;
 	
-	`INC(dc);
-	`INC(recv_count);
+	// DPP timeout, only counts while waiting on the payload
+	if(rx_state == RX_DPH_0 || rx_state == RX_DPH_1) `INC(recv_count);
 	
 	case(rx_state)
 	RX_RESET: rx_state <= RX_IDLE;
@@ -428,7 +434,6 @@ always @(posedge local_clk) begin
 		tx_dph_seq		<= out_dpp_seq;
 		tx_dph_len		<= out_length; // TODO
 
-		dc <= 0;
 		if(tx_dpp_ack) tx_state <= TX_DP_1;
 	end
 	TX_DP_1: begin
@@ -169,7 +169,6 @@ usb3_link iu3l (
 	wire	[1:0]	prot_endp_mode_rx;
 	wire	[1:0]	prot_endp_mode_tx;
 	wire	[6:0]	prot_dev_addr;
-	wire			prot_configured;
 
 	wire			prot_rx_tp;
 	wire			prot_rx_tp_hosterr;
@@ -362,7 +361,7 @@ usb3_protocol iu3r (
 	// tell the rest of the USB controller about what
 	// our current device address is, assigned by host
 	.dev_addr				( prot_dev_addr ),
-	.configured				( prot_configured )
+	.configured				( )
 );
 
 endmodule
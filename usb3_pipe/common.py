@@ -25,12 +25,17 @@ def LinkConfig(reset=0, loopback=0, scrambling=1):
 
 # Symbols (6.3.5) ----------------------------------------------------------------------------------
 
-class Symbol:
+class Symbol(int):
     """Symbol definition with name, 8-bit value and description"""
-    def __init__(self, name, value, description=""):
-        self.name        = name
-        self.value       = value
-        self.description = description
+    def __new__(cls, name, value, description=""):
+        symbol = int.__new__(cls, value)
+        symbol.name        = name
+        symbol.description = description
+        return symbol
+
+    @property
+    def value(self):
+        return int(self)
 
 SKP =  Symbol("SKP", K(28, 1), "Skip")
 SDP =  Symbol("SDP", K(28, 2), "Start Data Packet")
@@ -49,20 +54,16 @@ symbols = [SKP, SDP, EDB, SUB, COM, RSD, SHP, END, SLC, EPF]
 
 class OrderedSet(list):
     """Ordered Set definition with name, 8-bit values and description"""
+    __slots__ = ("name", "values", "description", "_bytes")
     def __init__(self, name, values, description=""):
         self.name        = name
         self.values      = values
         self.description = description
         list.__init__(self, values)
+        self._bytes      = bytes(self)
 
     def to_bytes(self):
-        r = bytes()
-        for e in self:
-            if isinstance(e, Symbol):
-                r += bytes([e.value])
-            else:
-                r += bytes([e])
-        return r
+        return self._bytes
 
 TSEQ = OrderedSet("TSEQ",
     [COM,      D(31, 7), D(23, 0), D( 0, 6)] +
@@ -97,6 +98,7 @@ class EndiannessSwap(Module):
         assert len(sink.ctrl) == len(source.ctrl)
         self.comb += sink.connect(source, omit={"data", "ctrl"})
         n = len(sink.ctrl)
-        for i in range(n):
-            self.comb += source.data[8*i:8*(i+1)].eq(sink.data[8*(n-1-i):8*(n-1-i+1)])
-            self.comb += source.ctrl[i].eq(sink.ctrl[n-1-i])
+        self.comb += [
+            source.data.eq(Cat(*[sink.data[8*i:8*(i+1)] for i in reversed(range(n))])),
+            source.ctrl.eq(Cat(*[sink.ctrl[i]           for i in reversed(range(n))])),
+        ]
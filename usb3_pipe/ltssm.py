@@ -6,8 +6,6 @@
 
 from migen import *
 
-from migen.genlib.misc import WaitTimer
-
 # Link Training and Status State Machine -----------------------------------------------------------
 
 # Note: Currently just FSM skeletons with states/transitions.
@@ -185,13 +183,27 @@ class PollingFSM(Module):
         rx_lfps_seen  = Signal()
         rx_ts2_seen   = Signal()
 
-        # 360ms Timer ------------------------------------------------------------------------------
-        _360_ms_timer = WaitTimer(int(360e-3*sys_clk_freq))
-        self.submodules += _360_ms_timer
-
-        # 12ms Timer -------------------------------------------------------------------------------
-        _12_ms_timer = WaitTimer(int(12e-3*sys_clk_freq))
-        self.submodules += _12_ms_timer
+        # 360ms/12ms Timers -----------------------------------------------------------------------
+        # The 360ms (LFPS) and 12ms (Active/Configuration) timeouts are never armed in the same state
+        # and an unarmed state always separates them, so both are taps on one counter cleared when idle.
+        # Without timers, the counter is not generated and done stays low.
+        _360_ms_timer = Record([("wait", 1), ("done", 1)])
+        _12_ms_timer  = Record([("wait", 1), ("done", 1)])
+        if with_timers:
+            timer_count = Signal(max=int(360e-3*sys_clk_freq) + 1)
+            self.comb += [
+                _360_ms_timer.done.eq(timer_count == int(360e-3*sys_clk_freq)),
+                _12_ms_timer.done.eq( timer_count == int( 12e-3*sys_clk_freq)),
+            ]
+            self.sync += [
+                If(_360_ms_timer.wait | _12_ms_timer.wait,
+                    If(~_360_ms_timer.done,
+                        timer_count.eq(timer_count + 1)
+                    )
+                ).Else(
+                    timer_count.eq(0)
+                )
+            ]
 
         # FSM --------------------------------------------------------------------------------------
         self.submodules.fsm = fsm = FSM(reset_state="Polling.Entry")
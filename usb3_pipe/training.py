@@ -36,8 +36,9 @@ class TSChecker(Module):
         self.comb += self.sink.ready.eq(1)
 
         # Memory -----------------------------------------------------------------------------------
-        mem_depth = len(ordered_set.to_bytes())//4
-        mem_init  = [int.from_bytes(ordered_set.to_bytes()[4*i:4*(i+1)], "little") for i in range(mem_depth)]
+        mem_bytes = ordered_set.to_bytes()
+        mem_depth = len(mem_bytes)//4
+        mem_init  = [int.from_bytes(mem_bytes[4*i:4*(i+1)], "little") for i in range(mem_depth)]
         mem       = Memory(32, mem_depth, mem_init)
         port      = mem.get_port(async_read=True)
         self.specials += mem, port
@@ -131,8 +132,9 @@ class TSGenerator(Module):
         run         = Signal()
 
         # Memory --------------------------------------------------------------------------------
-        mem_depth = len(ordered_set.to_bytes())//4
-        mem_init  = [int.from_bytes(ordered_set.to_bytes()[4*i:4*(i+1)], "little") for i in range(mem_depth)]
+        mem_bytes = ordered_set.to_bytes()
+        mem_depth = len(mem_bytes)//4
+        mem_init  = [int.from_bytes(mem_bytes[4*i:4*(i+1)], "little") for i in range(mem_depth)]
         mem       = Memory(32, mem_depth, mem_init)
         port      = mem.get_port(async_read=True)
         self.specials += mem, port